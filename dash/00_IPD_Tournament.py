@@ -5,13 +5,13 @@ This is the *entry point* most readers will launch first.  It:
 
 1.   Collects hyper-parameters for the Universal Trust Model (UTM) via the
      sidebar (see `dash/shared.py`).
-2.   Spawns an asynchronous tournament worker (`dash.background.run_async`)
-     so the UI stays responsive.
+2.   Spawns an asynchronous tournament worker process
+     (`dash.background.submit_run`) so the UI stays responsive.
 3.   Shows live progress and then renders a leaderboard + plots.
 
 What is **IPD-specific** here?
     • The page title / icon and labels
-    • The call to `run_async`, which ultimately runs
+    • The call to `submit_run`, which ultimately runs
       `tournaments.run_round_robin` (Axelrod-based).
 
 All UTM math lives in `utm/`  — this file only orchestrates the UI.
@@ -21,7 +21,7 @@ No functional logic below is altered by adding this doc-string.
 
 from __future__ import annotations
 import time, logging
-from queue import Queue, Empty
+from queue import Empty
 
 import streamlit as st
 
@@ -32,11 +32,14 @@ st.set_page_config(
 )
 
 from dash.state import init_state
-from dash.background import EXECUTOR, run_async
+from dash.background import cached_result, progress_channel, submit_run, warm_up
 from dash.utils import summarise_run, render_results
-from dash.shared import sidebar
+from dash.shared import load_presets, sidebar
 
 log = logging.getLogger("utm.ipd")
+PROGRESS_MIN_INTERVAL_S = 0.05   # throttle for progress-bar redraws
+
+warm_up()
 state = init_state()
 cfg = sidebar(page_id="ipd_tournament", show_tournament_actions=True)
 
@@ -49,11 +52,10 @@ if cfg["run_clicked"]:
     state.summary_md = summarise_run(**cfg)
     run_area.info(state.summary_md)
     log.info(state.summary_md.replace("**", ""))
-    state.progress_q = Queue()
-    state.running = True
-    state.future = EXECUTOR.submit(
-        run_async,
-        utm_presets=cfg["utm_presets"],
+    # Resolve presets here: the worker cannot use the Streamlit-cached loader.
+    presets = load_presets()
+    run_kw = dict(
+        presets={name: presets.get(name, {}) for name in cfg["utm_presets"]},
         utm_variant=cfg["utm_variant"],
         theta=cfg["theta"],
         alpha_pos=cfg["alpha_pos"],
@@ -67,29 +69,59 @@ if cfg["run_clicked"]:
         selected_names=cfg["selected_names"],
         extra_cls=cfg["extra_cls"].strip(),
         noise_wrap=cfg["noise_wrap"],
-        progress_q=state.progress_q,
     )
+    cached = cached_result(**run_kw)
+    if cached is not None:
+        # Identical seeded run already finished in this process – reuse it.
+        log.info("Reusing cached tournament result")
+        state.running = False
+        state.future = None
+        run_area.empty()
+        with run_area.container():
+            render_results(state, *cached, copy_key=f"copy_{time.time_ns()}")
+    else:
+        state.progress_q, state.progress_evt = progress_channel()
+        state.running = True
+        state.future = submit_run(
+            **run_kw,
+            progress_q=state.progress_q,
+            progress_evt=state.progress_evt,
+        )
+        # Wake the progress loop immediately if the worker exits without a
+        # final "done" message (exception / cancellation).
+        state.future.add_done_callback(lambda _f, evt=state.progress_evt: evt.set())
 
 if state.running and state.future:
-    if "progress_q" not in state:
-        state.progress_q = Queue()
+    if "progress_q" not in state or "progress_evt" not in state:
+        state.progress_q, state.progress_evt = progress_channel()
     progress_bar = st.progress(0, text="Running tournament … 0%")
-    last_pct = 0
+    pct = last_pct = 0
+    last_update_t = time.monotonic()
     done_flag = False
     while not done_flag and not state.future.done():
-        try:
-            msg = state.progress_q.get(timeout=0.1)
+        # Block until the worker signals new progress; the timeout only
+        # bounds how long a missed signal can stall the loop.
+        state.progress_evt.wait(timeout=0.25)
+        state.progress_evt.clear()
+        while True:
+            try:
+                msg = state.progress_q.get_nowait()
+            except Empty:
+                break
             if msg == ("done", "done"):
-                progress_bar.progress(100, text="Running tournament … 100%")
                 done_flag = True
-            else:
-                completed, total = msg
-                pct = int(completed / total * 100)
-                if pct > last_pct:
-                    last_pct = pct
-                    progress_bar.progress(pct, text=f"Running tournament … {pct}%")
-        except Empty:
-            pass
+                break
+            completed, total = msg
+            if total:
+                pct = max(pct, int(completed / total * 100))
+        if done_flag:
+            progress_bar.progress(100, text="Running tournament … 100%")
+        elif pct > last_pct and (
+            pct == 100 or time.monotonic() - last_update_t > PROGRESS_MIN_INTERVAL_S
+        ):
+            # Each update is a websocket roundtrip; cap them at ~20 per second.
+            last_pct, last_update_t = pct, time.monotonic()
+            progress_bar.progress(pct, text=f"Running tournament … {pct}%")
     if state.future.done():
         progress_bar.progress(100, text="Running tournament … 100%")
     progress_bar.empty()
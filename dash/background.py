@@ -1,6 +1,8 @@
 from __future__ import annotations
-import logging, random
-from concurrent.futures import ThreadPoolExecutor
+import atexit, logging, multiprocessing, os, random, threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
 from queue import Queue
 from typing import List, Tuple
 
@@ -9,26 +11,104 @@ import numpy as np
 import pandas as pd
 import tqdm as _tqdm_mod
 
-from strategies.utm_tft import UTMTFT
-from strategies.utm_wsls import UTMWSLS
-from strategies.utm_tft_wsls import UTMTFT_WSLS
-from strategies.utm_pure      import TrustOnlyIPDStrategy
+from strategies import UTMTFT, UTM_REGISTRY
 from tournaments.run_round_robin import run_tournament
-from dash.opponents import build_extra_opponent
-from dash.shared import PRESETS
+from dash.opponents import build_extra_opponent, strategy_class
 
 logger = logging.getLogger("utm.ipd")
-EXECUTOR = ThreadPoolExecutor(max_workers=1)
-
-UTM_REGISTRY = {
-    "TFT": UTMTFT,
-    "WSLS": UTMWSLS,
-    "TFT→WSLS": UTMTFT_WSLS,
-    "Trust-only IPD": TrustOnlyIPDStrategy,
-}
+# Tournaments run in a separate process so they never contend with the
+# Streamlit script thread for the GIL.  Axelrod already forces "spawn".
+# The worker and the progress manager start on first use, not on import.
+_EXECUTOR: ProcessPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+_MANAGER = None
+_MANAGER_LOCK = threading.Lock()
+_ORIG_TQDM = _tqdm_mod.tqdm
+MIN_PARALLEL_MATCHES = 20   # below this, process start-up outweighs the gain
 
 ReturnType = Tuple[pd.DataFrame, List[axl.Player], axl.ResultSet | None]
 
+# Finished tournaments, shared by every session in this server process.
+# Runs are fully seeded, so identical settings give identical results.
+RESULT_CACHE_MAX = 16
+_RESULT_CACHE: OrderedDict[tuple, ReturnType] = OrderedDict()
+_RESULT_LOCK = threading.Lock()
+_UNCACHED_ARGS = {"progress_q", "progress_evt"}
+
+def _executor() -> ProcessPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+        return _EXECUTOR
+
+def _manager():
+    global _MANAGER
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            _MANAGER = multiprocessing.get_context("spawn").Manager()
+            atexit.register(_MANAGER.shutdown)
+        return _MANAGER
+
+def progress_channel() -> tuple[Queue, threading.Event]:
+    """Return a (queue, event) pair the worker process can signal through."""
+    manager = _manager()
+    return manager.Queue(), manager.Event()
+
+def _freeze(value):
+    """Hashable, order-stable copy of *value* (nested dicts and lists)."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in sorted(value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _result_key(kwargs: dict) -> tuple:
+    # Nested values are frozen by content, so preset specs key the run
+    # by their parameters, not just their names.
+    return _freeze({k: v for k, v in kwargs.items() if k not in _UNCACHED_ARGS})
+
+def cached_result(**kwargs) -> ReturnType | None:
+    """Return the stored result of an identical earlier run, if any."""
+    key = _result_key(kwargs)
+    with _RESULT_LOCK:
+        hit = _RESULT_CACHE.get(key)
+        if hit is not None:
+            _RESULT_CACHE.move_to_end(key)
+        return hit
+
+def _store_result(kwargs: dict, future: Future) -> None:
+    if future.cancelled() or future.exception() is not None:
+        return
+    with _RESULT_LOCK:
+        _RESULT_CACHE[_result_key(kwargs)] = future.result()
+        while len(_RESULT_CACHE) > RESULT_CACHE_MAX:
+            _RESULT_CACHE.popitem(last=False)
+
+def submit_run(**kwargs) -> Future:
+    """Start `background_task` on the worker; remember its result when done."""
+    future = _executor().submit(background_task, **kwargs)
+    future.add_done_callback(partial(_store_result, kwargs))
+    return future
+
+def _warm_up() -> None:
+    """No-op job: makes the worker import Axelrod before the first run."""
+
+def warm_up() -> None:
+    """Start the worker and the progress manager ahead of the first run.
+
+    Both pay a slow Axelrod import on start-up, so the tournament page calls
+    this on load.  Spawned children re-run the page as ``__mp_main__``; only
+    the server process may start them.
+    """
+    if multiprocessing.current_process().name != "MainProcess" or _EXECUTOR is not None:
+        return
+    _executor().submit(_warm_up)
+    threading.Thread(target=_manager, name="utm-progress-manager", daemon=True).start()
+
 def _df_from_summary(s):
     if isinstance(s, pd.DataFrame):
         return s.reset_index(drop=True)
@@ -44,22 +124,53 @@ def _df_from_summary(s):
             return pd.DataFrame(s).reset_index(drop=True)
     raise TypeError("unexpected summary format")
 
-def _patch_tqdm(progress_q: Queue):
-    orig_tqdm = _tqdm_mod.tqdm
+def _notify(progress_q: Queue, progress_evt: threading.Event | None, msg) -> None:
+    """Enqueue a progress message and wake the UI thread waiting on it."""
+    progress_q.put(msg)
+    if progress_evt is not None:
+        progress_evt.set()
+
+def _patch_tqdm(progress_q: Queue, progress_evt: threading.Event | None = None):
+    # Wrap the pristine tqdm so repeated runs in one worker don't stack up.
     def _streamlit_tqdm(*args, **kwargs):
-        bar = orig_tqdm(*args, **kwargs)
-        progress_q.put((0, bar.total))
+        bar = _ORIG_TQDM(*args, **kwargs)
+        _notify(progress_q, progress_evt, (0, bar.total))
         orig_update = bar.update
         def update(n=1, _=None):
             orig_update(n)
-            progress_q.put((bar.n, bar.total))
+            _notify(progress_q, progress_evt, (bar.n, bar.total))
         bar.update = update
         return bar
     _tqdm_mod.tqdm = _streamlit_tqdm
 
+def _tournament_processes(n_players: int) -> int | None:
+    """Worker processes for one tournament, or None to play serially.
+
+    Axelrod hands each worker whole matches (a pairing with all of its
+    repetitions), so the gate counts round-robin matches, self-play
+    included, and never asks for more workers than there are matches.
+    One core is left for the Streamlit server.  Axelrod reads any value
+    below 2 as "every core", so the serial case must be None.
+    """
+    matches = n_players * (n_players + 1) // 2
+    workers = min((os.cpu_count() or 1) - 1, matches)
+    if matches < MIN_PARALLEL_MATCHES or workers < 2:
+        return None
+    return workers
+
+# ResultSet attributes that cannot be pickled back to the Streamlit process:
+# the spent "Analysing" bar holds a stream handle, and `summarise()` stores
+# its function-local namedtuple class as `player`.
+_UNPICKLABLE_RESULT_ATTRS = ("progress_bar", "player")
+
+def _strip_unpicklable(results: axl.ResultSet) -> None:
+    for attr in _UNPICKLABLE_RESULT_ATTRS:
+        if hasattr(results, attr):
+            delattr(results, attr)
+
 def background_task(
     *,
-    utm_presets: list[str],
+    presets: dict[str, dict],
     utm_variant: str,
     theta: float,
     alpha_pos: float,
@@ -74,17 +185,15 @@ def background_task(
     noise_wrap: bool,
     noise_pct: int,
     progress_q: Queue,
+    progress_evt: threading.Event | None = None,
 ) -> ReturnType:
     random.seed(seed)
     np.random.seed(seed)
-    _patch_tqdm(progress_q)
+    _patch_tqdm(progress_q, progress_evt)
 
-    players: List[axl.Player] = [
-        next(cls for cls in axl.strategies if cls.name == n)() for n in selected_names
-    ]
+    players: List[axl.Player] = [strategy_class(n)() for n in selected_names]
 
-    for name in utm_presets:
-        spec = PRESETS.get(name, {})
+    for name, spec in presets.items():
         variant = spec.get("variant", utm_variant)
         cls = UTM_REGISTRY.get(variant, UTMTFT)
         p = cls(
@@ -106,6 +215,7 @@ def background_task(
         players.append(extra_player)
 
     players.insert(0, UTM_REGISTRY[utm_variant](theta, alpha_pos, alpha_neg, delta, threshold))
+    processes = _tournament_processes(len(players))
 
     if noise_pct == 0:
         leaderboard_df, results = run_tournament(
@@ -116,6 +226,7 @@ def background_task(
             quiet=False,
             csv_dir=None,
             return_results=True,
+            processes=processes,
         )
     else:
         tournament = axl.Tournament(
@@ -125,12 +236,15 @@ def background_task(
             seed=seed,
             noise=noise_pct / 100.0,
         )
-        results = tournament.play(progress_bar=True)
+        results = tournament.play(progress_bar=True, processes=processes)
         leaderboard_df = _df_from_summary(results.summarise())
 
-    progress_q.put(("done", "done"))
+    if results is not None:
+        _strip_unpicklable(results)
+
+    _notify(progress_q, progress_evt, ("done", "done"))
     logger.info("Run summary:\n%s", leaderboard_df.to_string(index=False))
     return leaderboard_df.reset_index(drop=True), players, results
 
 run_async = background_task
-__all__ = ["EXECUTOR", "run_async"]
+__all__ = ["cached_result", "progress_channel", "run_async", "submit_run", "warm_up"]
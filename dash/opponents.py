@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import axelrod as axl
 
 NO_EXTRA_OPPONENT = "None"
@@ -15,10 +17,30 @@ _APPROVED_EXTRA_NAMES: tuple[str, ...] = (
 )
 
 
+@lru_cache(maxsize=1)
+def _strategies() -> dict[str, type[axl.Player]]:
+    """Short-run-time Axelrod strategies keyed by display name, built once."""
+    return {cls.name: cls for cls in axl.short_run_time_strategies}
+
+
+def strategy_names() -> list[str]:
+    """Return the opponent names offered in the dashboard sidebar."""
+    return list(_strategies())
+
+
+def strategy_class(name: str) -> type[axl.Player]:
+    """Return the Axelrod strategy class whose display name is *name*."""
+    return _strategies()[name]
+
+
 def approved_extra_opponents() -> dict[str, type[axl.Player]]:
     """Return the fixed public allowlist for optional extra opponents."""
-    by_name = {cls.name: cls for cls in axl.strategies}
-    return {name: by_name[name] for name in _APPROVED_EXTRA_NAMES if name in by_name}
+    strategies = _strategies()
+    return {
+        name: strategies[name]
+        for name in _APPROVED_EXTRA_NAMES
+        if name in strategies
+    }
 
 
 def extra_opponent_options() -> list[str]:
@@ -18,7 +18,7 @@ process:
 
 UI Inputs
 ---------
-* **Generations** – fixed horizon (or runs to fixation on older Axelrod versions)
+* **Generations** – fixed horizon (stops early at fixation on older Axelrod versions)
 * **Population size** – integer 5 – 50
 * Sidebar controls for the UTM hyper-parameters (handled in *dash.shared*).
 
@@ -41,7 +41,10 @@ from __future__ import annotations
 # ---------------------------------------------------------------------------
 # Standard-library
 # ---------------------------------------------------------------------------
+import inspect
 import logging
+from collections.abc import Mapping
+from itertools import islice
 
 # ---------------------------------------------------------------------------
 # Third-party
@@ -66,24 +69,14 @@ st.set_page_config(
 # ---------------------------------------------------------------------------
 from dash.shared import sidebar          # helper to render sidebar controls
 from dash.state import init_state        # session-state initialisation
-from strategies.utm_tft import UTMTFT
-from strategies.utm_wsls import UTMWSLS
-from strategies.utm_tft_wsls import UTMTFT_WSLS
-from strategies.utm_pure import TrustOnlyIPDStrategy
+from strategies import UTM_REGISTRY     # strategy registry for dropdown
 
 logger = logging.getLogger("utm.ipd")
 if not logging.getLogger().hasHandlers():     # fallback if user code sets none
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
-# ---------------------------------------------------------------------------
-# Strategy registry for dropdown
-# ---------------------------------------------------------------------------
-UTM_REGISTRY = {
-    "TFT":      UTMTFT,
-    "WSLS":     UTMWSLS,
-    "TFT→WSLS": UTMTFT_WSLS,
-    "Trust-only IPD": TrustOnlyIPDStrategy,
-}
+# Axelrod ≥ 5 caps the run with play(n=…); older versions only iterate.
+_MP_HAS_N = "n" in inspect.signature(axl.MoranProcess.play).parameters
 
 # ══════════════════════════════ UI BODY ═══════════════════════════════════
 
@@ -117,28 +110,40 @@ if st.button("Run Moran", key="moran_run"):
     # ── 2. Run process ──────────────────────────────────────────────────
     mp = axl.MoranProcess(population, turns=200)
 
-    try:                       # Axelrod ≥ 5 returns a DataFrame
+    if _MP_HAS_N:              # Axelrod ≥ 5 returns a DataFrame
         counts = mp.play(n=generations)
-    except TypeError:          # Older versions run to fixation and return list
-        mp.play()
-        counts = mp.populations
+    else:                      # Older versions: step to the horizon or fixation
+        for _ in islice(mp, generations - 1):
+            pass
+        counts = mp.populations[:generations]
 
     # ── 3. Extract UTM share per generation ─────────────────────────────
+    utm_key = str(utm_player)                       # Axelrod keys players by str()
     if isinstance(counts, pd.DataFrame):
-        df = counts.cumsum()                        # cumulative birth events
-        utm_col = next(c for c in df.columns if str(c).startswith("UTM-"))
-        share = df[utm_col] / pop_size
-        gens = df.index
-    else:                                           # list-of-lists fallback
-        utm_counts = [
-            sum(getattr(p, "name", p).startswith("UTM-") for p in pop)
-            for pop in counts
-        ]
-        share = np.array(utm_counts) / pop_size
+        utm_col = (
+            utm_key if utm_key in counts.columns
+            else next(c for c in counts.columns if str(c).startswith("UTM-"))
+        )
+        births = counts[utm_col].to_numpy()         # UTM column only
+        share = np.cumsum(births) / pop_size        # cumulative birth events
+        gens = counts.index
+    else:                                           # per-generation populations
+        # Counters keyed by str(player); bare player lists on very old releases.
+        # Moran clones players on reproduction, so lists are matched by str().
+        utm_counts = np.fromiter(
+            (
+                pop.get(utm_key, 0) if isinstance(pop, Mapping)
+                else sum(str(p) == utm_key for p in pop)
+                for pop in counts
+            ),
+            dtype=np.int32,
+            count=len(counts),
+        )
+        share = utm_counts / pop_size
         gens = range(len(share))
 
     # ── 4. Summary metrics ──────────────────────────────────────────────
-    final_share = float(share[-1] if isinstance(share, np.ndarray) else share.iloc[-1])
+    final_share = float(share[-1])
     mean_share = float(share.mean())
     fixation_gen = next((i for i, s in enumerate(share) if s in (0.0, 1.0)), None)
 
@@ -31,14 +31,12 @@ from __future__ import annotations
 # Standard-library imports
 # ---------------------------------------------------------------------------
 import logging
-import random
 
 # ---------------------------------------------------------------------------
 # Third-party imports
 # ---------------------------------------------------------------------------
 import numpy as np
 import streamlit as st
-from matplotlib import pyplot as plt  # noqa: F401  (used by st.line_chart backend)
 
 # ---------------------------------------------------------------------------
 # Internal imports
@@ -67,10 +65,15 @@ def run_trust_game(
     alpha_neg: float,
     delta: float,
     tau: float,
+    seed: int | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
     """
     Simulate *rounds* of the trust game.
 
+    Betrayals and the would-be payoff of every round are sampled up-front
+    as NumPy vectors; only the trust recurrence (which gates whether the
+    investor sends at all) is stepped round by round.
+
     Returns
     -------
     trust_vals : ndarray
@@ -86,23 +89,24 @@ def run_trust_game(
         threshold=tau,
     )
 
-    trust_vals: list[float] = []
-    payoffs: list[float] = []
+    rng = np.random.default_rng(seed)
+    betrayed = rng.random(rounds) < betray_prob
+    # Payoff the investor would receive in each round *if* it sends.
+    payoff_if_sent = -send + send * 3 * np.where(betrayed, ret_bad, ret_good)
 
-    for _ in range(rounds):
-        betrayed = random.random() < betray_prob
+    trust_vals = np.empty(rounds, dtype=np.float64)
+    payoffs = np.zeros(rounds, dtype=np.float64)
+    meter = agent.trust
 
-        sent = send if agent.trust.value >= tau else 0.0
-        returned = sent * 3 * (ret_bad if betrayed else ret_good)
-        payoff = -sent + returned
+    for i in range(rounds):
+        if meter.value >= tau:
+            payoffs[i] = payoff_if_sent[i]
 
         # Update trust: +1 for profit, −1 for loss
-        agent.trust.observe(+1 if payoff >= 0 else -1)
-
-        trust_vals.append(agent.trust.value)
-        payoffs.append(payoff)
+        meter.observe(+1 if payoffs[i] >= 0 else -1)
+        trust_vals[i] = meter.value
 
-    return np.array(trust_vals), np.array(payoffs)
+    return trust_vals, payoffs
 
 
 # ═══════════════════════════ UI  ═══════════════════════════════════════════
@@ -8,41 +8,78 @@ dash/shared.py  –  common helpers & sidebar for the Streamlit IPD dashboard.
 
 IPD-specific bits:
     • default opponent list (Axelrod strategy names)
-    • `_load_presets()` reward lookup (can pull from S3)
+    • `load_presets()` reward lookup (can pull from S3)
 
 Everything else is generic dashboard/UI code; swap the opponent list and
 presets loader to port UTM to another repeated-game environment.
 """
 
 from __future__ import annotations
-import pathlib, streamlit as st, logging, os, yaml, datetime, uuid, json
-from dash.opponents import NO_EXTRA_OPPONENT, extra_opponent_options
+import io, pathlib, streamlit as st, os, yaml, datetime, uuid, json
+from dash.opponents import NO_EXTRA_OPPONENT, extra_opponent_options, strategy_names
 from utm.log_config import setup_logging
 
-if "libs" not in st.session_state:
+try:                                      # libyaml parses in C when available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:                       # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
+@st.cache_resource(show_spinner=False)
+def _libs():
+    """Import the heavy libraries once per server process, not per session."""
     setup_logging(level_console="INFO")
-    log = logging.getLogger("utm.ipd")
     import axelrod as axl
-    from strategies.utm_tft import UTMTFT
-    from strategies.utm_wsls import UTMWSLS
-    from strategies.utm_tft_wsls import UTMTFT_WSLS
-    from strategies.utm_pure import TrustOnlyIPDStrategy
-    st.session_state.libs = (
-        axl,
-        [cls.name for cls in axl.strategies],
-        {
-            "TFT":        UTMTFT,
-            "WSLS":       UTMWSLS,
-            "TFT→WSLS":   UTMTFT_WSLS,
-            "Trust-only IPD": TrustOnlyIPDStrategy,
-        },
-    )
+    from strategies import UTM_REGISTRY
+    return axl, tuple(sorted(strategy_names(), key=str.casefold)), UTM_REGISTRY
 
 
-axl, STRATEGY_NAMES, UTM_REGISTRY = st.session_state.libs
+axl, STRATEGY_NAMES, UTM_REGISTRY = _libs()
+_DEFAULT_BOTS = (
+    "Tit For Tat", "Defector", "Win-Stay Lose-Shift", "Random",
+    "ZD-Extort-2", "EvolvedLookerUp2_2_2", "AON2",
+    "Adaptive Pavlov 2011", "Meta Hunter",
+)
 _LOGO = pathlib.Path(__file__).parent / "static" / "IgnitumSolutions_Logo.png"
+_GIT_SHA: str | None = os.getenv("GIT_SHA")    # baked into the image; read once
+_VERSION_MD = (
+    f"**Version:** [`{(_GIT_SHA or 'unknown')[:7]}`]"
+    f"(https://github.com/ignitum-solutions/utm-ipd/commit/{_GIT_SHA or 'unknown'})"
+)
+
+# Managed-transfer tuning: below the threshold one GET beats several ranged ones.
+_S3_MULTIPART_THRESHOLD = 512 * 1024
+_S3_MULTIPART_CHUNK = 256 * 1024
+_S3_MAX_CONCURRENCY = 16
+
+
+@st.cache_resource(show_spinner=False)
+def _s3():
+    """Process-wide S3 client; keeps credentials and the HTTPS pool warm."""
+    import boto3
+
+    return boto3.client("s3")
+
+
+@st.cache_resource(show_spinner=False)
+def _s3_transfer_config():
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=_S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=_S3_MULTIPART_CHUNK,
+        max_concurrency=_S3_MAX_CONCURRENCY,
+    )
+
+
+def _read_s3_object(s3, bucket: str, key: str) -> bytes:
+    """Read an S3 object; large ones arrive as parallel, ETag-pinned ranges."""
+    buf = io.BytesIO()
+    s3.download_fileobj(bucket, key, buf, Config=_s3_transfer_config())
+    return buf.getvalue()
 
-def _load_presets() -> dict:
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_presets() -> dict:
     """
     Load UTM personality presets from either:
 
@@ -51,25 +88,43 @@ def _load_presets() -> dict:
 
     The S3 option lets instructors update classroom presets without
     redeploying the app.  File format:   {preset_name: {theta: …, …}}
+
+    Cached for five minutes, so reruns skip the S3 round-trip and the parse
+    while edited presets still show up without a restart.
     """
     uri = os.getenv("PRESETS_S3_URI", "config/presets.yaml")
     if uri.startswith("s3://"):
-        import boto3
-
-        s3 = boto3.client("s3")
         bucket, key = uri.replace("s3://", "").split("/", 1)
-        body = s3.get_object(Bucket=bucket, Key=key)["Body"].read()
-        return yaml.safe_load(body) or {}
+        body = _read_s3_object(_s3(), bucket, key)
+        return yaml.load(body, Loader=_YamlLoader) or {}
     try:
         with open(uri, "r") as fh:
-            return yaml.safe_load(fh) or {}
+            return yaml.load(fh, Loader=_YamlLoader) or {}
     except FileNotFoundError:
         return {}
 
-PRESETS: dict = _load_presets()
-
 def _fmt(x): return "—" if x is None else f"{x:.2f}"
 
+@st.cache_data(ttl=300, show_spinner=False)
+def _preset_tooltips() -> dict[str, str]:
+    """Sidebar help text per preset.
+
+    Cached on its own five-minute timer, so for a while after a preset edit
+    its names can differ from what `load_presets` returns.
+    """
+    return {
+        name: (
+            f"Creator: {spec.get('creator','Unknown')}\n"
+            f"{spec.get('description','')}\n\n"
+            f"θ={_fmt(spec.get('theta'))}  "
+            f"α⁺={_fmt(spec.get('alpha_pos'))}  "
+            f"α⁻={_fmt(spec.get('alpha_neg'))}\n"
+            f"δ={_fmt(spec.get('delta'))}  "
+            f"τ={_fmt(spec.get('tau'))}"
+        )
+        for name, spec in load_presets().items()
+    }
+
 def _suggest_preset_expander(page_id: str) -> None:
     """Render suggestion controls inline so no modal survives page changes."""
     with st.sidebar.expander("Suggest a UTM preset"):
@@ -94,24 +149,24 @@ def _suggest_preset_expander(page_id: str) -> None:
         prefix = os.getenv("SUBMIT_PREFIX")
         if prefix:
             try:
-                import boto3
+                s3 = _s3()
             except ModuleNotFoundError:
                 st.error("Preset submissions require boto3 to be installed.")
                 return
 
             bucket, *rest = prefix.replace("s3://", "").split("/", 1)
             key = f"{(rest[0] if rest else '')}{datetime.datetime.utcnow():%Y%m%dT%H%M%SZ}_{uuid.uuid4().hex}.json"
-            boto3.client("s3").put_object(
-                Bucket=bucket,
-                Key=key,
-                Body=json.dumps(
-                    dict(
-                        name=name, creator=creator, theta=theta,
-                        alpha_pos=alpha_pos, alpha_neg=alpha_neg,
-                        delta=delta, tau=tau, description=desc
-                    )
-                ).encode(),
-                ContentType="application/json",
+            body = io.BytesIO(json.dumps(
+                dict(
+                    name=name, creator=creator, theta=theta,
+                    alpha_pos=alpha_pos, alpha_neg=alpha_neg,
+                    delta=delta, tau=tau, description=desc
+                )
+            ).encode())
+            s3.upload_fileobj(
+                body, bucket, key,
+                ExtraArgs={"ContentType": "application/json"},
+                Config=_s3_transfer_config(),
             )
             st.toast("Suggestion saved; thanks.")
             st.rerun()
@@ -128,69 +183,65 @@ def sidebar(*, page_id: str = "ipd_tournament", show_tournament_actions: bool =
         st.logo(str(_LOGO), size="large")
 
     c: dict = {}
-    st.sidebar.markdown("### UTM parameters")
-    c["theta"] = st.sidebar.slider("θ Initial Trust", 0.0, 1.0, 0.6, 0.01)
-    c["alpha_pos"] = st.sidebar.slider("α⁺ Learning Rate (+)", 0.0, 0.5, 0.02, 0.001)
-    c["alpha_neg"] = st.sidebar.slider("α⁻ Learning Rate (-)", 0.0, 1.0, 0.675, 0.01)
-    c["delta"] = st.sidebar.slider("δ Betrayal Ramp", 0.0, 1.0, 0.45, 0.01)
-    c["threshold"] = st.sidebar.slider("τ Threshold", 0.05, 1.0, 0.5, 0.01)
-    c["utm_variant"] = st.sidebar.radio("Inner strategy", list(UTM_REGISTRY.keys()), horizontal=True)
+    # On the tournament page the parameter widgets sit in one form, so moving
+    # a slider does not rerun the script; only the Run button submits them.
+    panel = (
+        st.sidebar.form("params", border=False) if show_tournament_actions
+        else st.sidebar
+    )
+    panel.markdown("### UTM parameters")
+    c["theta"] = panel.slider("θ Initial Trust", 0.0, 1.0, 0.6, 0.01)
+    c["alpha_pos"] = panel.slider("α⁺ Learning Rate (+)", 0.0, 0.5, 0.02, 0.001)
+    c["alpha_neg"] = panel.slider("α⁻ Learning Rate (-)", 0.0, 1.0, 0.675, 0.01)
+    c["delta"] = panel.slider("δ Betrayal Ramp", 0.0, 1.0, 0.45, 0.01)
+    c["threshold"] = panel.slider("τ Threshold", 0.05, 1.0, 0.5, 0.01)
+    c["utm_variant"] = panel.radio("Inner strategy", list(UTM_REGISTRY.keys()), horizontal=True)
 
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### Classic opponents")
+    panel.markdown("---")
+    panel.markdown("### Classic opponents")
 
     # ─── Opponent selection (IPD-specific) ────────────────────────────────
     # Strategy names come straight from Axelrod-Python.  Swap this list if
     # you plug UTM into another repeated-game framework.
 
-    default_bots = [
-        "Tit For Tat", "Defector", "Win-Stay Lose-Shift", "Random",
-        "ZD-Extort-2", "EvolvedLookerUp2_2_2", "AON2",
-        "Adaptive Pavlov 2011", "Meta Hunter",
-    ]
-    c["selected_names"] = st.sidebar.multiselect("Choose bots", STRATEGY_NAMES, default=default_bots)
+    c["selected_names"] = panel.multiselect("Choose bots", STRATEGY_NAMES, default=_DEFAULT_BOTS)
 
-    st.sidebar.markdown("#### UTM personalities (Battle-Royale)")
+    panel.markdown("#### UTM personalities (Battle-Royale)")
     preset_selections: list[str] = []
-    with st.sidebar.expander("Select personalities"):
-        for name, spec in PRESETS.items():
-            tip = (
-                f"Creator: {spec.get('creator','Unknown')}\n"
-                f"{spec.get('description','')}\n\n"
-                f"θ={_fmt(spec.get('theta'))}  "
-                f"α⁺={_fmt(spec.get('alpha_pos'))}  "
-                f"α⁻={_fmt(spec.get('alpha_neg'))}\n"
-                f"δ={_fmt(spec.get('delta'))}  "
-                f"τ={_fmt(spec.get('tau'))}"
-            )
+    with panel.expander("Select personalities"):
+        for name, tip in _preset_tooltips().items():
             if st.checkbox(name, key=f"preset_{name}", help=tip):
                 preset_selections.append(name)
     c["utm_presets"] = preset_selections
 
-    with st.sidebar.expander("Advanced: approved extra opponent"):
+    with panel.expander("Advanced: approved extra opponent"):
         c["extra_cls"] = st.selectbox(
             "Extra opponent",
             extra_opponent_options(),
             index=0,
             help="Only approved built-in Axelrod strategies are available on the public demo.",
         )
-        c["noise_wrap"] = st.checkbox(
+        # Inside the form, changing the selectbox does not rerun the script,
+        # so the checkbox stays enabled there and is ignored at read time.
+        noise_wrap = st.checkbox(
             "Add 5 % noise wrapper",
             value=False,
-            disabled=c["extra_cls"] == NO_EXTRA_OPPONENT,
+            disabled=not show_tournament_actions and c["extra_cls"] == NO_EXTRA_OPPONENT,
+            help="Applies to the extra opponent only.",
         )
+        c["noise_wrap"] = noise_wrap and c["extra_cls"] != NO_EXTRA_OPPONENT
 
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### Tournament")
-    c["rounds"] = st.sidebar.number_input("Rounds / match", 50, 1000, 200, 50)
-    c["reps"] = st.sidebar.number_input("Repetitions", 1, 100, 30)
-    c["seed"] = st.sidebar.number_input("Seed", 0, 9999, 42)
-    c["noise_pct"] = st.sidebar.slider("Noise (%)", 0, 20, 0)
+    panel.markdown("---")
+    panel.markdown("### Tournament")
+    c["rounds"] = panel.number_input("Rounds / match", 50, 1000, 200, 50)
+    c["reps"] = panel.number_input("Repetitions", 1, 100, 30)
+    c["seed"] = panel.number_input("Seed", 0, 9999, 42)
+    c["noise_pct"] = panel.slider("Noise (%)", 0, 20, 0)
 
     c["run_clicked"] = False
     if show_tournament_actions:
-        st.sidebar.markdown("---")
-        st.sidebar.markdown(
+        panel.markdown("---")
+        panel.markdown(
             """
             <style>
             .run-sim button{font-size:18px!important;font-weight:700!important;width:100%!important;background:#1f77b4!important;color:white!important;}
@@ -198,7 +249,7 @@ def sidebar(*, page_id: str = "ipd_tournament", show_tournament_actions: bool =
             """,
             unsafe_allow_html=True,
         )
-        c["run_clicked"] = st.sidebar.button("▶ Run simulation", key="run_sim", help="Start tournament", type="primary", use_container_width=True)
+        c["run_clicked"] = panel.form_submit_button("▶ Run simulation", key="run_sim", help="Start tournament", type="primary", use_container_width=True)
         st.sidebar.markdown("---")
         if st.sidebar.button("Reset History", key="reset_history"):
             st.session_state.get("history", []).clear()
@@ -209,10 +260,7 @@ def sidebar(*, page_id: str = "ipd_tournament", show_tournament_actions: bool =
         "Research prototype only. Do not submit confidential or sensitive information."
     )
 
-    sha = os.getenv("GIT_SHA", "unknown")
-    st.sidebar.markdown(
-        f"**Version:** [`{sha[:7]}`](https://github.com/ignitum-solutions/utm-ipd/commit/{sha})"
-    )
+    st.sidebar.markdown(_VERSION_MD)
     st.session_state.update(c)
     return c
 
@@ -222,5 +270,5 @@ def git_sha(short: bool = True, default: str = "dev") -> str:
     • short=True  → first 7 chars   (e.g. 1a2b3c4)
     • short=False → full 40-char SHA
     """
-    sha = os.getenv("GIT_SHA", default)
+    sha = _GIT_SHA or default
     return sha[:7] if short else sha
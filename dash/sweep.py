@@ -0,0 +1,262 @@
+"""
+dash/sweep.py  –  tournament workers behind the Mini-Sweep page.
+
+Streamlit page scripts are not importable modules, so everything handed to
+a `ProcessPoolExecutor` has to live here to be picklable.  Sweep points are
+grouped into a few jobs (see `batch_means`), spread over worker processes
+to sidestep the GIL.
+
+Presets are passed in as plain spec dicts (not names) so the jobs need
+nothing from the Streamlit-bound `dash.shared` module.  Workers are spawned,
+though, and spawned children re-run the page Streamlit installed as
+``__main__``: the Mini-Sweep page keeps its body behind a ``__main__``
+guard, so they only repeat its imports (Streamlit, `dash.shared` and its
+logging setup).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Callable, Sequence, Tuple
+
+import axelrod as axl
+import pandas as pd
+
+from dash.opponents import build_extra_opponent, strategy_class
+from dash.sweep_guard import ensure_sweep_execution_allowed, ensure_sweep_time_remaining
+from tournaments.run_round_robin import run_tournament
+from utm.trust_meter import temporary_ipd_reward_values
+from strategies import UTMTFT, UTM_REGISTRY
+
+logger = logging.getLogger("utm.ipd")
+
+Grid = Tuple[float, float, float, float, float]       # θ, α⁺, α⁻, δ, τ
+
+RewardGrid = Tuple[float, float, float, float]  # R(CC), R(DC), R(DD), R(CD)
+
+_BATCHES_PER_WORKER = 4     # > 1 keeps progress and time checks granular
+
+# Every spawned child re-imports Axelrod, so the pool is started on the first
+# parallel sweep and kept for the later ones.
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def build_preset_player(spec: dict) -> axl.Player:
+    variant = spec.get("variant", "TFT")
+    cls = UTM_REGISTRY.get(variant, UTMTFT)
+    return cls(
+        spec.get("theta", 0.6),
+        spec.get("alpha_pos", 0.02),
+        spec.get("alpha_neg", 0.7),
+        spec.get("delta", 0.4),
+        spec.get("tau", 0.5),
+    )
+
+
+def _field(
+    opponents: list[str],
+    presets: dict[str, dict],
+    extra_cls: str,
+    noise_wrap: bool,
+) -> list[axl.Player]:
+    players: list[axl.Player] = [strategy_class(n)() for n in opponents]
+
+    for name, spec in presets.items():
+        pl = build_preset_player(spec)
+        pl.name = name
+        players.append(pl)
+
+    extra = build_extra_opponent(extra_cls, noise_wrap=noise_wrap)
+    if extra is not None:
+        players.append(extra)
+    return players
+
+
+def _replays_identically(players: Sequence[axl.Player], noise_pct: int) -> bool:
+    """True when no noise and no stochastic player make matches seed-dependent."""
+    return noise_pct <= 0 and not any(axl.Classifiers["stochastic"](p) for p in players)
+
+
+def batch_means(
+    variant: str,
+    points: Sequence[Grid],
+    *,
+    turns: int,
+    reps: int,
+    seed: int,
+    noise_pct: int,
+    opponents: list[str],
+    presets: dict[str, dict],
+    extra_cls: str,
+    noise_wrap: bool,
+    reward_params: RewardGrid | None = None,
+) -> list[float]:
+    """
+    Return each UTM parameterisation's mean score against the field.
+
+    Each mean matches a stand-alone tournament of that UTM player vs the
+    field.  When the field replays identically (no noise, no stochastic
+    player), all *points* enter one tournament as separate UTM players, and
+    its edges pair every UTM player with every field player and nothing
+    else: the tournament setup and analysis are paid once per batch, and
+    the single repetition stands for all of them.
+
+    Otherwise every point gets its own tournament.  Axelrod seeds each match
+    by its position in the tournament, so a batched point's mean would
+    depend on its slot in the batch.
+    """
+    ensure_sweep_execution_allowed()
+    utm_players: list[axl.Player] = []
+    for i, (θ, αp, αn, δ, τ) in enumerate(points):
+        pl = UTM_REGISTRY[variant](θ, αp, αn, δ, τ)
+        pl.name = f"UTM-sweep-{i}"
+        utm_players.append(pl)
+
+    field = _field(opponents, presets, extra_cls, noise_wrap)
+    if not field:
+        logger.warning("Sweep field is empty; no UTM means to report.")
+        return [float("nan")] * len(utm_players)
+
+    def _means(
+        players: list[axl.Player],
+        repetitions: int,
+        edges: list[tuple[int, int]] | None = None,
+    ) -> pd.Series:
+        df = run_tournament(
+            players,
+            turns=turns,
+            repetitions=repetitions,
+            seed=seed,
+            noise=noise_pct / 100.0,
+            quiet=True,
+            csv_dir=None,
+            edges=edges,
+        )
+        return df.set_index("Player")["Mean"]
+
+    with (
+        temporary_ipd_reward_values(*reward_params) if reward_params is not None
+        else nullcontext()
+    ):
+        if not _replays_identically(utm_players + field, noise_pct):
+            return [float(_means([pl] + field, reps)[str(pl)]) for pl in utm_players]
+
+        if reps > 1:
+            logger.info("Deterministic sweep field, no noise → reps %d → 1", reps)
+        k = len(utm_players)
+        edges = [(i, k + j) for i in range(k) for j in range(len(field))]
+        means = _means(utm_players + field, 1, edges)
+    return [float(means[str(pl)]) for pl in utm_players]
+
+
+def _sweep_worker(job: tuple[str, list[Grid], RewardGrid | None, int, dict]) -> list[float]:
+    variant, points, reward_params, log_level, common = job
+    # Spawned children start with default logging; follow the caller's level.
+    logger.setLevel(log_level)
+    return batch_means(variant, points, reward_params=reward_params, **common)
+
+
+def sweep_worker_count(jobs: int) -> int:
+    """Worker processes for *jobs* batches; one core is left for Streamlit."""
+    return max(1, min((os.cpu_count() or 1) - 1, jobs))
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=sweep_worker_count(os.cpu_count() or 1))
+            atexit.register(_POOL.shutdown, wait=False, cancel_futures=True)
+        return _POOL
+
+
+def _batches(
+    points: Sequence[tuple[Grid, RewardGrid | None]],
+    n_batches: int,
+) -> list[tuple[list[int], RewardGrid | None]]:
+    """Split point indices into ≤ *n_batches* groups sharing a reward matrix."""
+    by_reward: dict[RewardGrid | None, list[int]] = {}
+    for i, (_, r) in enumerate(points):
+        by_reward.setdefault(r, []).append(i)
+
+    per_group = max(1, n_batches // len(by_reward))
+    batches = []
+    for r, idx in by_reward.items():
+        size = -(-len(idx) // per_group)  # ceil division
+        batches += [(idx[j:j + size], r) for j in range(0, len(idx), size)]
+    return batches
+
+
+def run_sweep(
+    variant: str,
+    points: Sequence[tuple[Grid, RewardGrid | None]],
+    *,
+    started_at: float,
+    on_progress: Callable[[float], None] | None = None,
+    **common,
+) -> list[float]:
+    """
+    Evaluate every ``(utm_params, reward_params)`` point.
+
+    Points sharing a reward matrix are grouped into batches, each evaluated
+    by one `batch_means` call; batches are spread over a shared process
+    pool.  With one worker or a single batch they run in this process
+    instead, since the pool would add process start-up without any
+    parallelism.  Repeated points are evaluated once and share their mean.
+    Results come back in *points* order.
+    ``common`` holds the remaining `batch_means` keyword arguments.
+
+    Raises
+    ------
+    SweepTimeoutError
+        If the sweep budget runs out; queued batches are cancelled and the
+        call returns only after in-flight tournaments have finished.
+    """
+    means: list[float] = [float("nan")] * len(points)
+    if not points:
+        return means
+
+    # Random sampling can draw the same point twice; evaluate it once.
+    slots: dict[tuple[Grid, RewardGrid | None], list[int]] = {}
+    for i, point in enumerate(points):
+        slots.setdefault(tuple(point), []).append(i)
+    unique = list(slots)
+
+    workers = sweep_worker_count(len(unique))
+    batches = _batches(unique, workers * _BATCHES_PER_WORKER)
+    log_level = logger.getEffectiveLevel()
+    jobs = [
+        (variant, [unique[i][0] for i in idx], r, log_level, common)
+        for idx, r in batches
+    ]
+
+    futures: list[Future] = []
+    if workers == 1 or len(jobs) == 1:
+        results = map(_sweep_worker, jobs)
+    else:
+        pool = _pool()
+        futures = [pool.submit(_sweep_worker, job) for job in jobs]
+        results = (f.result() for f in futures)
+
+    done = 0
+    try:
+        for (idx, _), batch in zip(batches, results):
+            ensure_sweep_time_remaining(started_at)
+            for i, mean in zip(idx, batch):
+                for j in slots[unique[i]]:
+                    means[j] = mean
+            done += len(idx)
+            if on_progress is not None:
+                on_progress(done / len(unique))
+    finally:
+        # The pool outlives this sweep: drop queued batches, let running ones end.
+        for f in futures:
+            f.cancel()
+        wait(futures)
+    return means
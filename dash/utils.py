@@ -1,7 +1,5 @@
 from __future__ import annotations
-import os
 import pandas as pd, streamlit as st
-import yaml
 from pandas.errors import PyperclipException
 from dash.opponents import NO_EXTRA_OPPONENT
 from .plots import render_plots
@@ -10,13 +8,33 @@ def _ensure_header(df: pd.DataFrame) -> pd.DataFrame:
     df = df.reset_index(drop=True)
     if "Mean" in df.columns:
         return df
-    hdr_idx = next((i for i, row in df.iterrows() if "Mean" in row.values), None)
-    if hdr_idx is not None:
+    is_hdr = (df.to_numpy().astype(str) == "Mean").any(axis=1)
+    if is_hdr.any():
+        hdr_idx = int(is_hdr.argmax())
         hdr = df.iloc[hdr_idx].astype(str).tolist()
         df = df.iloc[hdr_idx + 1:].copy()
         df.columns = hdr
     return df.reset_index(drop=True)
 
+def _typed_leaderboard(df: pd.DataFrame) -> pd.DataFrame:
+    """Give every column a concrete dtype so Streamlit ships typed Arrow data.
+
+    Header-rescued or summary-built frames arrive with text columns; numeric
+    ones are parsed, the rest become categoricals.  Already-typed frames
+    (e.g. `state.last_leaderboard` on a rerender) pass through untouched.
+    """
+    df = _ensure_header(df)
+    df.columns = df.columns.map(str)
+    for col in df.columns:
+        dtype = df[col].dtype
+        if pd.api.types.is_numeric_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+            continue
+        try:
+            df[col] = pd.to_numeric(df[col])
+        except (TypeError, ValueError):
+            df[col] = df[col].astype("category")
+    return df
+
 def summarise_run(**kw) -> str:
     strat_list = [f"UTM-{kw['utm_variant']}", *kw["selected_names"]]
     if kw["extra_cls"] and kw["extra_cls"] != NO_EXTRA_OPPONENT:
@@ -30,8 +48,7 @@ def summarise_run(**kw) -> str:
     )
 
 def render_results(state, df: pd.DataFrame, players, results, copy_key: str):
-    df = _ensure_header(df)
-    df.columns = df.columns.map(str)
+    df = _typed_leaderboard(df)
     st.success("✅ Tournament completed")
     st.dataframe(df, use_container_width=True, hide_index=True)
     if st.button("📋 Copy leaderboard", key=copy_key):
@@ -47,18 +64,3 @@ def render_results(state, df: pd.DataFrame, players, results, copy_key: str):
     state.last_players = players
     state.last_results = results
     state.have_results = True
-
-def _load_presets() -> dict:
-    """YAML from repo OR s3://bucket/key if PRESETS_S3_URI is set."""
-    uri = os.getenv("PRESETS_S3_URI", "config/presets.yaml")
-    if uri.startswith("s3://"):
-        import boto3
-
-        s3 = boto3.client("s3")
-        bucket, key = uri.replace("s3://", "").split("/", 1)
-        body = s3.get_object(Bucket=bucket, Key=key)["Body"].read()
-        return yaml.safe_load(body)
-    with open(uri, "r") as fh:
-        return yaml.safe_load(fh)
-
-PRESETS = _load_presets()
@@ -1,5 +1,6 @@
 import argparse
 import logging
+import os
 
 from utm.log_config import setup_logging
 from tournaments.run_round_robin import run_tournament
@@ -79,6 +80,12 @@ if __name__ == "__main__":
     p = argparse.ArgumentParser()
     p.add_argument("--rounds", type=int, default=200)
     p.add_argument("--reps",   type=int, default=30)
+    p.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for the matches (1 = serial)",
+    )
     p.add_argument(
         "--players",
         nargs="*",
@@ -87,9 +94,10 @@ if __name__ == "__main__":
     )
     args = p.parse_args()
     logger.info(
-        "Parsed args: rounds=%d, reps=%d, players=%s",
+        "Parsed args: rounds=%d, reps=%d, processes=%d, players=%s",
         args.rounds,
         args.reps,
+        args.processes,
         args.players,
     )
 
@@ -116,5 +124,12 @@ if __name__ == "__main__":
         args.rounds,
         args.reps,
     )
-    run_tournament(player_objs, turns=args.rounds, repetitions=args.reps)
+    # Axelrod reads processes < 2 as "all cores", so serial runs pass None.
+    processes = args.processes if args.processes > 1 else None
+    run_tournament(
+        player_objs,
+        turns=args.rounds,
+        repetitions=args.reps,
+        processes=processes,
+    )
     logger.info("Tournament completed")
@@ -0,0 +1,22 @@
+"""UTM-wrapped Axelrod strategies and the registry the dashboard picks from."""
+
+from .utm_tft import UTMTFT
+from .utm_wsls import UTMWSLS
+from .utm_tft_wsls import UTMTFT_WSLS
+from .utm_pure import TrustOnlyIPDStrategy
+
+#: Inner-strategy labels, in the order the sidebar offers them.
+UTM_LABELS: tuple[str, ...] = ("TFT", "WSLS", "TFT→WSLS", "Trust-only IPD")
+UTM_CLASSES: tuple[type, ...] = (UTMTFT, UTMWSLS, UTMTFT_WSLS, TrustOnlyIPDStrategy)
+
+UTM_REGISTRY: dict[str, type] = dict(zip(UTM_LABELS, UTM_CLASSES))
+
+__all__ = [
+    "UTMTFT",
+    "UTMWSLS",
+    "UTMTFT_WSLS",
+    "TrustOnlyIPDStrategy",
+    "UTM_LABELS",
+    "UTM_CLASSES",
+    "UTM_REGISTRY",
+]
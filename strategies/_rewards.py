@@ -0,0 +1,51 @@
+"""Per-match snapshot of the IPD reward matrix, keyed by Axelrod actions."""
+
+from __future__ import annotations
+
+import logging
+
+from axelrod.action import Action
+
+from utm.trust_meter import ipd_reward_lookup
+
+C, D = Action.C, Action.D
+
+RewardTable = dict[Action, dict[Action, float]]
+
+
+def reward_table() -> RewardTable:
+    """Return ``table[my_move][opp_move]`` for the current reward matrix.
+
+    UTM strategies take this snapshot in ``__init__``, which Axelrod re-runs
+    before every match, so reward-matrix overrides (see
+    `temporary_ipd_reward_values`) still apply per match while each round
+    costs two dict lookups instead of a `payoff_to_signed_reward` call.
+    """
+    return ipd_reward_lookup(C, D)
+
+
+class RoundRewardMixin:
+    """Track rounds played and the latest signed reward for UTM players.
+
+    List it before ``axl.Player`` in the bases.  ``_round`` counts finished
+    rounds and ``_last_reward`` holds the signed reward of the latest one,
+    so `strategy` need not index the histories.  The reward table is
+    re-snapshotted whenever ``__init__`` runs, i.e. once per match.
+
+    ``_debug`` tells `strategy` whether the strategy module's logger is at
+    DEBUG.  Like the reward table it is read once per match, so per-round
+    logging costs a bool test instead of a logger lookup.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._round: int = 0
+        self._last_reward: float = 0.0
+        self._rewards: RewardTable = reward_table()
+        self._debug: bool = logging.getLogger(type(self).__module__).isEnabledFor(logging.DEBUG)
+
+    def update_history(self, play: Action, coplay: Action) -> None:
+        """Record the round and pre-compute its signed reward."""
+        super().update_history(play, coplay)
+        self._round += 1
+        self._last_reward = self._rewards[play][coplay]
@@ -18,12 +18,13 @@ import logging
 import axelrod as axl
 from axelrod.action import Action
 
-from utm.trust_meter import TrustMeter, payoff_to_signed_reward
+from strategies._rewards import RoundRewardMixin
+from utm.trust_meter import TrustMeter
 
 logger = logging.getLogger(__name__)
 
 
-class TrustOnlyIPDStrategy(axl.Player):
+class TrustOnlyIPDStrategy(RoundRewardMixin, axl.Player):
     """
     Trust-only IPD strategy.
 
@@ -90,53 +91,54 @@ class TrustOnlyIPDStrategy(axl.Player):
         """Decide next move (“C” or “D”) based solely on UTM trust level."""
 
         # Observe previous round (if any)
-        if self.history:
-            last_my: str = self.history[-1]
-            last_opp: str = opponent.history[-1]
-            reward: float = payoff_to_signed_reward(last_my, last_opp)
-            round_n: int = len(self.history) + 1
+        round_n: int = self._round + 1
+        trust = self.trust
+        threshold = self.threshold
+        verbose = self._debug and round_n <= 10   # avoid log spam on long runs
 
-            if round_n <= 10:
+        if self._round:
+            if verbose:
                 logger.debug(
                     "Rnd %d • pre-observe: trust=%.3f / τ=%.3f, last=(%s,%s)",
                     round_n,
-                    self.trust.value,
-                    self.threshold,
-                    last_my,
-                    last_opp,
+                    trust.value,
+                    threshold,
+                    self.history[-1],
+                    opponent.history[-1],
                 )
 
-            self.trust.observe(reward)
+            trust.observe(self._last_reward)
 
-            if round_n <= 10:
+            if verbose:
                 logger.debug(
                     "Rnd %d • post-observe: trust=%.3f (R=%.3f, betrayals=%d)",
                     round_n,
-                    self.trust.value,
-                    reward,
-                    getattr(self.trust, "_betrayals", 0),
+                    trust.value,
+                    self._last_reward,
+                    getattr(trust, "_betrayals", 0),
                 )
 
-        current_trust: float = self.trust.value
-        next_round: int = len(self.history) + 1
+        current_trust: float = trust.value
 
         # Trust-only IPD decision rule
-        if current_trust < self.threshold:
+        if current_trust < threshold:
             decision: str = Action.D
-            logger.debug(
-                "Rnd %d • trust %.3f < τ %.3f → DEFECT",
-                next_round,
-                current_trust,
-                self.threshold,
-            )
+            if verbose:
+                logger.debug(
+                    "Rnd %d • trust %.3f < τ %.3f → DEFECT",
+                    round_n,
+                    current_trust,
+                    threshold,
+                )
         else:
             decision = Action.C
-            logger.debug(
-                "Rnd %d • trust %.3f ≥ τ %.3f → COOPERATE",
-                next_round,
-                current_trust,
-                self.threshold,
-            )
+            if verbose:
+                logger.debug(
+                    "Rnd %d • trust %.3f ≥ τ %.3f → COOPERATE",
+                    round_n,
+                    current_trust,
+                    threshold,
+                )
 
         return decision
 
@@ -30,7 +30,8 @@ import logging
 
 import axelrod as axl
 from axelrod.action import Action
-from utm.trust_meter import TrustMeter, payoff_to_signed_reward
+from strategies._rewards import RoundRewardMixin
+from utm.trust_meter import TrustMeter
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -45,7 +46,7 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
-class UTMTFT(axl.Player):
+class UTMTFT(RoundRewardMixin, axl.Player):
     """Tit-for-Tat enhanced with the Universal Trust Meter.
 
     Parameters
@@ -140,32 +141,32 @@ class UTMTFT(axl.Player):
         """Decide the next move (“C” or “D”) given *opponent*’s history."""
 
         # ------------------- Observe previous round ------------------- #
-        if self.history:  # skip on very first move
-            last_my: str = self.history[-1]
-            last_opp: str = opponent.history[-1]
-            reward: float = payoff_to_signed_reward(last_my, last_opp)
-            round_n: int = len(self.history) + 1
+        round_n: int = self._round + 1
+        trust = self.trust
+        threshold = self.threshold
+        verbose = self._debug and round_n <= 10   # avoid log spam on long runs
 
-            if round_n <= 10:  # avoid log spam on long tournaments
+        if self._round:  # skip on very first move
+            if verbose:
                 logger.debug(
                     "Rnd %d • pre-observe: trust=%.3f / τ=%.3f, last=(%s,%s)",
                     round_n,
-                    self.trust.value,
-                    self.threshold,
-                    last_my,
-                    last_opp,
+                    trust.value,
+                    threshold,
+                    self.history[-1],
+                    opponent.history[-1],
                 )
 
             # Update trust based on signed reward
-            self.trust.observe(reward)
+            trust.observe(self._last_reward)
 
-            if round_n <= 10:
+            if verbose:
                 logger.debug(
                     "Rnd %d • post-observe: trust=%.3f (Δ=%.3f, betrayals=%d)",
                     round_n,
-                    self.trust.value,
-                    reward,
-                    getattr(self.trust, "_betrayals", 0),
+                    trust.value,
+                    self._last_reward,
+                    getattr(trust, "_betrayals", 0),
                 )
 
         # ------------------------- Decide ----------------------------- #
@@ -173,26 +174,27 @@ class UTMTFT(axl.Player):
         proposed_move: str = self.inner.strategy(opponent)
 
         # 2. Override if trust is too low.
-        current_trust: float = self.trust.value
-        next_round: int = len(self.history) + 1
+        current_trust: float = trust.value
 
-        if current_trust < self.threshold:
+        if current_trust < threshold:
             decision: str = Action.D  # “D” is also a valid Action subclass
-            logger.debug(
-                "Rnd %d • trust %.3f < τ %.3f → DEFECT",
-                next_round,
-                current_trust,
-                self.threshold,
-            )
+            if verbose:
+                logger.debug(
+                    "Rnd %d • trust %.3f < τ %.3f → DEFECT",
+                    round_n,
+                    current_trust,
+                    threshold,
+                )
         else:
             decision = proposed_move
-            logger.debug(
-                "Rnd %d • trust %.3f ≥ τ %.3f → %s",
-                next_round,
-                current_trust,
-                self.threshold,
-                proposed_move,
-            )
+            if verbose:
+                logger.debug(
+                    "Rnd %d • trust %.3f ≥ τ %.3f → %s",
+                    round_n,
+                    current_trust,
+                    threshold,
+                    proposed_move,
+                )
 
         return decision
 
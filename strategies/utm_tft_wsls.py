@@ -24,11 +24,12 @@ This was an experiment to see if the Universal Trust Model could broach hybrid s
 from __future__ import annotations
 import logging, axelrod as axl
 from axelrod.action import Action
-from utm.trust_meter import TrustMeter, payoff_to_signed_reward
+from strategies._rewards import RoundRewardMixin
+from utm.trust_meter import TrustMeter
 
 logger = logging.getLogger(__name__)
 
-class UTMTFT_WSLS(axl.Player):
+class UTMTFT_WSLS(RoundRewardMixin, axl.Player):
     """TFT while trust is shaky → WSLS once trust is solid (>0.80)."""
 
     name = "UTM-TFT→WSLS"
@@ -49,25 +50,27 @@ class UTMTFT_WSLS(axl.Player):
         self.threshold = threshold
         self.promote_at = promote_at
         self.inner: axl.Player = axl.TitForTat()      # start cautious
+        self._promoted = False                        # inner switched to WSLS?
         logger.debug("Init UTM-TFT→WSLS (θ=%.2f τ=%.2f promote=%.2f)",
                      theta, threshold, promote_at)
 
     def strategy(self, opponent: axl.Player) -> str:
-        if self.history:
-            r = payoff_to_signed_reward(self.history[-1], opponent.history[-1])
-            self.trust.observe(r)
+        trust = self.trust
+        if self._round:
+            trust.observe(self._last_reward)
 
         # upgrade inner engine the first time trust soars past promote_at
-        if (self.trust.value > self.promote_at and
-                not isinstance(self.inner, axl.WinStayLoseShift)):
+        if not self._promoted and trust.value > self.promote_at:
             self.inner = axl.WinStayLoseShift()
+            self._promoted = True
             logger.debug("Trust %.3f > promote_at %.2f → switch to WSLS",
-                         self.trust.value, self.promote_at)
+                         trust.value, self.promote_at)
 
         move = self.inner.strategy(opponent)
-        return Action.D if self.trust.value < self.threshold else move
+        return Action.D if trust.value < self.threshold else move
 
     def reset(self) -> None:
         super().reset(); self.trust.reset()
         self.inner = axl.TitForTat()     # reset to cautious
+        self._promoted = False
         logger.debug("UTM-TFT→WSLS reset")
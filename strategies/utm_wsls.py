@@ -23,12 +23,13 @@ from __future__ import annotations
 import logging
 import axelrod as axl
 from axelrod.action import Action
-from utm.trust_meter import TrustMeter, payoff_to_signed_reward
+from strategies._rewards import RoundRewardMixin
+from utm.trust_meter import TrustMeter
 
 logger = logging.getLogger(__name__)
 
 
-class UTMWSLS(axl.Player):
+class UTMWSLS(RoundRewardMixin, axl.Player):
     """Win-Stay-Lose-Shift governed by a Universal Trust Meter (UTM).
 
     The inner WSLS engine cooperates on mutual C and repeats D only
@@ -70,15 +71,14 @@ class UTMWSLS(axl.Player):
     # ---------------------------------------------------------------
     def strategy(self, opponent: axl.Player) -> str:
         """Choose C/D this turn, updating trust after the previous turn."""
-        if self.history:
-            last_my, last_opp = self.history[-1], opponent.history[-1]
-            reward = payoff_to_signed_reward(last_my, last_opp)
-            self.trust.observe(reward)
+        trust = self.trust
+        if self._round:
+            trust.observe(self._last_reward)
 
         # Inner engine’s suggestion
         proposed = self.inner.strategy(opponent)
         # Gate through trust threshold
-        return Action.D if self.trust.value < self.threshold else proposed
+        return Action.D if trust.value < self.threshold else proposed
 
     # ---------------------------------------------------------------
     def reset(self) -> None:
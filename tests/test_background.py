@@ -0,0 +1,91 @@
+import importlib.util
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import Future
+from queue import Queue
+
+import axelrod as axl
+import pytest
+
+import dash.background as background
+from dash.background import progress_channel, submit_run
+from dash.opponents import NO_EXTRA_OPPONENT
+
+_RUN = dict(
+    presets={}, utm_variant="TFT",
+    theta=0.6, alpha_pos=0.02, alpha_neg=0.7, delta=0.4, threshold=0.5,
+    rounds=10, reps=2, seed=3,
+    selected_names=["Tit For Tat", "Defector"],
+    extra_cls=NO_EXTRA_OPPONENT, noise_wrap=False,
+)
+
+# The real worker round trip spawns a process that re-imports Axelrod.
+_SPAWN_TESTS_ENV = "RUN_SPAWN_TESTS"
+
+
+class _PicklingExecutor:
+    """Runs jobs inline, but sends results through pickle like the worker."""
+
+    def submit(self, fn, /, **kwargs) -> Future:
+        future: Future = Future()
+        future.set_result(pickle.loads(pickle.dumps(fn(**kwargs))))
+        return future
+
+
+@pytest.fixture
+def inline_worker(monkeypatch):
+    monkeypatch.setattr(background, "_executor", _PicklingExecutor)
+    monkeypatch.setattr(background, "_RESULT_CACHE", type(background._RESULT_CACHE)())
+    # background_task installs its progress hook on tqdm; undo it afterwards
+    monkeypatch.setattr(background._tqdm_mod, "tqdm", background._ORIG_TQDM)
+
+
+def test_import_starts_no_worker_or_manager():
+    # Execute a fresh copy, so earlier tests that started either do not count
+    spec = importlib.util.spec_from_file_location("_fresh_background", background.__file__)
+    fresh = importlib.util.module_from_spec(spec)
+    children, threads = multiprocessing.active_children(), threading.active_count()
+    spec.loader.exec_module(fresh)
+
+    assert fresh._EXECUTOR is None
+    assert fresh._MANAGER is None
+    assert multiprocessing.active_children() == children
+    assert threading.active_count() == threads
+
+
+def test_noisy_run_survives_pickling(inline_worker):
+    future = submit_run(**_RUN, noise_pct=5, progress_q=Queue(), progress_evt=threading.Event())
+    df, players, results = future.result()
+
+    assert len(df) == len(players) == 3
+    assert isinstance(results, axl.ResultSet)
+    assert results.num_players == 3
+
+
+@pytest.mark.skipif(not os.getenv(_SPAWN_TESTS_ENV), reason=f"set {_SPAWN_TESTS_ENV}=1 to run")
+def test_noisy_run_survives_the_trip_back_from_the_worker():
+    q, evt = progress_channel()
+    future = submit_run(**_RUN, noise_pct=5, progress_q=q, progress_evt=evt)
+    df, players, results = future.result(timeout=300)
+
+    assert len(df) == len(players) == 3
+    assert isinstance(results, axl.ResultSet)
+    assert results.num_players == 3
+
+
+def test_result_key_covers_preset_contents():
+    spec = {"variant": "TFT", "theta": 0.6}
+    key = background._result_key(dict(_RUN, presets={"Cautious": spec}))
+    edited = background._result_key(dict(_RUN, presets={"Cautious": {**spec, "theta": 0.2}}))
+    assert key != edited
+    assert key == background._result_key(dict(_RUN, presets={"Cautious": dict(spec)}))
+
+
+def test_tournament_processes_gate_on_matches_not_repetitions(monkeypatch):
+    monkeypatch.setattr(background.os, "cpu_count", lambda: 8)
+    assert background._tournament_processes(2) is None     # 3 matches
+    assert background._tournament_processes(40) == 7       # 820 matches
+    monkeypatch.setattr(background.os, "cpu_count", lambda: 2)
+    assert background._tournament_processes(40) is None    # one spare core only
@@ -1,7 +1,12 @@
 import pytest
 import axelrod as axl
 
-from dash.opponents import NO_EXTRA_OPPONENT, build_extra_opponent, extra_opponent_options
+from dash.opponents import (
+    NO_EXTRA_OPPONENT,
+    build_extra_opponent,
+    extra_opponent_options,
+    strategy_class,
+)
 from dash.sweep_guard import (
     ENABLE_SWEEP_ENV,
     SweepBusyError,
@@ -76,3 +81,11 @@ def test_trust_only_ipd_strategy_is_ipd_scoped():
     player = TrustOnlyIPDStrategy(theta=0.6, threshold=0.5)
     assert player.name == "Trust-only IPD"
     assert player.strategy(axl.TitForTat()) == axl.Action.C
+
+
+def test_strategy_class_resolves_axelrod_display_names():
+    assert strategy_class("Tit For Tat") is axl.TitForTat
+    with pytest.raises(KeyError):
+        strategy_class("os.system")
+    with pytest.raises(KeyError):
+        strategy_class("Meta Winner")  # long-run strategies are not offered
@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+
+import axelrod as axl
+import pytest
+
+from tournaments.run_round_robin import _coop_rates, run_tournament
+
+
+def test_coop_rates_fallback_excludes_self_play():
+    mat = [[0.9, 0.2, 0.4], [0.6, 0.1, 1.0], [0.0, 0.5, 0.7]]
+    rates = _coop_rates(SimpleNamespace(normalised_cooperation=mat))
+    assert rates == pytest.approx([0.3, 0.8, 0.25])
+
+
+def test_coop_rates_probe_each_result_not_its_type():
+    rated = SimpleNamespace(cooperating_rating=[0.5, 1.0])
+    matrix = SimpleNamespace(normalised_cooperation=[[1.0, 0.2], [0.6, 1.0]])
+    assert _coop_rates(rated) == [0.5, 1.0]
+    assert _coop_rates(matrix) == pytest.approx([0.2, 0.6])
+
+
+def test_leaderboard_sorted_by_mean_with_ties_in_entry_order():
+    players = [axl.Cooperator(), axl.Defector(), axl.Cooperator()]
+    players[0].name, players[2].name = "First", "Second"
+    df = run_tournament(players, turns=10, repetitions=1, seed=1, quiet=True)
+    assert df["Player"].tolist() == ["Defector", "First", "Second"]
+    assert df.index.tolist() == [0, 1, 2]
@@ -0,0 +1,116 @@
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import axelrod as axl
+import pytest
+
+import dash.sweep
+from dash.sweep import UTM_REGISTRY, _batches, _replays_identically, batch_means, run_sweep
+from dash.sweep_guard import ENABLE_SWEEP_ENV
+from tournaments.run_round_robin import run_tournament
+
+_COMMON = dict(
+    turns=30, reps=1, seed=7, noise_pct=0,
+    opponents=["Tit For Tat", "Defector", "Cooperator"],
+    presets={}, extra_cls="None", noise_wrap=False,
+)
+
+
+@pytest.fixture(autouse=True)
+def _enable_sweeps(monkeypatch):
+    monkeypatch.setenv(ENABLE_SWEEP_ENV, "true")
+
+
+def test_batch_means_match_standalone_tournaments():
+    points = [(0.6, 0.02, 0.7, 0.4, 0.5), (0.3, 0.05, 0.3, 0.2, 0.4)]
+    batched = batch_means("TFT", points, **_COMMON)
+
+    for p, mean in zip(points, batched):
+        players = [UTM_REGISTRY["TFT"](*p), axl.TitForTat(), axl.Defector(), axl.Cooperator()]
+        df = run_tournament(players, turns=30, repetitions=1, seed=7, quiet=True)
+        solo = df.loc[df["Player"].str.startswith("UTM-"), "Mean"].iloc[0]
+        assert math.isclose(mean, solo)
+
+
+def test_batches_keep_reward_matrices_apart():
+    p = (0.6, 0.02, 0.7, 0.4, 0.5)
+    r1, r2 = (1.0, 0.5, -0.2, -1.0), (1.1, 0.5, -0.2, -1.0)
+    batches = _batches([(p, r1), (p, r2), (p, r1)], n_batches=1)
+    assert batches == [([0, 2], r1), ([1], r2)]
+
+    assert _batches([(p, None)] * 5, n_batches=2) == [([0, 1, 2], None), ([3, 4], None)]
+
+
+def test_only_deterministic_noiseless_fields_replay_identically():
+    utm = UTM_REGISTRY["TFT"](0.6, 0.02, 0.7, 0.4, 0.5)
+    assert _replays_identically([utm, axl.TitForTat(), axl.Defector()], 0)
+    assert not _replays_identically([utm, axl.TitForTat()], 5)
+    assert not _replays_identically([utm, axl.Random()], 0)
+
+    common = dict(_COMMON, reps=3)
+    points = [(0.6, 0.02, 0.7, 0.4, 0.5)]
+    assert batch_means("TFT", points, **common) == batch_means("TFT", points, **_COMMON)
+
+
+def test_stochastic_field_means_do_not_depend_on_batch_slot():
+    common = dict(_COMMON, turns=50, reps=3, opponents=["Random", "Tit For Tat", "Defector"])
+    a, b = (0.6, 0.02, 0.7, 0.4, 0.5), (0.3, 0.05, 0.3, 0.2, 0.4)
+
+    first = batch_means("TFT", [a, b], **common)[0]
+    second = batch_means("TFT", [b, a], **common)[1]
+    alone = batch_means("TFT", [a], **common)[0]
+
+    players = [UTM_REGISTRY["TFT"](*a), axl.Random(), axl.TitForTat(), axl.Defector()]
+    df = run_tournament(players, turns=50, repetitions=3, seed=7, quiet=True)
+    solo = df.loc[df["Player"].str.startswith("UTM-"), "Mean"].iloc[0]
+    assert first == second == alone == pytest.approx(solo)
+
+
+def test_run_sweep_evaluates_repeated_points_once(monkeypatch):
+    seen = []
+
+    def fake_worker(job):
+        _, points, _, _, _ = job
+        seen.extend(points)
+        return [p[0] for p in points]
+
+    monkeypatch.setattr(dash.sweep, "_pool", lambda: ThreadPoolExecutor(2))
+    monkeypatch.setattr(dash.sweep, "sweep_worker_count", lambda jobs: 2)
+    monkeypatch.setattr(dash.sweep, "_sweep_worker", fake_worker)
+
+    a, b = (0.6, 0.02, 0.7, 0.4, 0.5), (0.3, 0.05, 0.3, 0.2, 0.4)
+    means = run_sweep("TFT", [(a, None), (b, None), (a, None)], started_at=time.time())
+
+    assert sorted(seen) == sorted([a, b])
+    assert means == [0.6, 0.3, 0.6]
+
+
+def test_single_worker_sweep_runs_in_process(monkeypatch):
+    def no_pool():
+        raise AssertionError("a one-worker sweep must not start a pool")
+
+    monkeypatch.setattr(dash.sweep, "_pool", no_pool)
+    monkeypatch.setattr(dash.sweep, "sweep_worker_count", lambda jobs: 1)
+
+    points = [(0.6, 0.02, 0.7, 0.4, 0.5), (0.3, 0.05, 0.3, 0.2, 0.4)]
+    means = run_sweep("TFT", [(p, None) for p in points], started_at=time.time(), **_COMMON)
+    assert means == batch_means("TFT", points, **_COMMON)
+
+
+def test_sweep_jobs_carry_the_caller_log_level(monkeypatch):
+    levels = []
+
+    def fake_worker(job):
+        levels.append(job[3])
+        return [float("nan")] * len(job[1])
+
+    monkeypatch.setattr(dash.sweep, "_pool", lambda: ThreadPoolExecutor(2))
+    monkeypatch.setattr(dash.sweep, "sweep_worker_count", lambda jobs: 2)
+    monkeypatch.setattr(dash.sweep, "_sweep_worker", fake_worker)
+    monkeypatch.setattr(dash.sweep.logger, "level", logging.WARNING)
+
+    a, b = (0.6, 0.02, 0.7, 0.4, 0.5), (0.3, 0.05, 0.3, 0.2, 0.4)
+    run_sweep("TFT", [(a, None), (b, None)], started_at=time.time())
+    assert levels and set(levels) == {logging.WARNING}
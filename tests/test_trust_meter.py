@@ -1,5 +1,11 @@
 import pytest
 from utm import TrustMeter
+from utm.trust_meter import (
+    ipd_reward_lookup,
+    payoff_to_signed_reward,
+    payoff_to_signed_rewards,
+    temporary_ipd_reward_values,
+)
 
 def test_trust_update_positive():
     tm = TrustMeter(theta=0.5)
@@ -10,4 +16,44 @@ def test_trust_update_positive():
 def test_trust_update_negative():
     tm = TrustMeter(theta=0.5)
     tm.observe(-1.0)
-    assert tm.value < 0.5
\ No newline at end of file
+    assert tm.value < 0.5
+
+
+def test_signed_rewards_match_the_scalar_mapping():
+    my, opp = [0, 0, 1, 1], [0, 1, 0, 1]
+    with temporary_ipd_reward_values(0.9, 0.4, -0.3, -0.8):
+        expected = [payoff_to_signed_reward("CD"[a], "CD"[b]) for a, b in zip(my, opp)]
+        assert payoff_to_signed_rewards(my, opp).tolist() == expected
+    with pytest.raises(ValueError):
+        payoff_to_signed_rewards([0, -1], [0, 0])
+
+
+def test_reward_lookup_matches_the_scalar_mapping():
+    with temporary_ipd_reward_values(0.9, 0.4, -0.3, -0.8):
+        table = ipd_reward_lookup(0, 1)
+        for my in "CD":
+            for opp in "CD":
+                assert table["CD".index(my)]["CD".index(opp)] == payoff_to_signed_reward(my, opp)
+
+
+def test_observe_many_replays_observe():
+    rewards = [1.0, -1.0, 0.5, -0.2, -1.0, 1.0, 1.0]
+    stepped = TrustMeter(theta=0.6)
+    trail = []
+    for r in rewards:
+        stepped.observe(r)
+        trail.append(stepped.value)
+
+    batched = TrustMeter(theta=0.6)
+    assert batched.observe_many(rewards).tolist() == trail
+    assert (batched.value, batched._betrayals) == (stepped.value, stepped._betrayals)
+
+    with pytest.raises(ValueError):
+        batched.observe_many([1.0, 0.0])
+    assert batched.value == stepped.value
+
+
+def test_reward_equal_to_trust_is_not_a_betrayal():
+    tm = TrustMeter(theta=1.0)
+    tm.observe(1.0)
+    assert (tm.value, tm._betrayals) == (1.0, 0)
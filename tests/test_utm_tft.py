@@ -1,7 +1,28 @@
 import axelrod as axl
 from strategies.utm_tft import UTMTFT
+from utm.trust_meter import TrustMeter, temporary_ipd_reward_values
 
 
 def test_first_move_cooperates():
     p1, p2 = UTMTFT(), axl.TitForTat()
     assert p1.strategy(p2) == axl.Action.C
+
+
+def test_trust_tracks_the_previous_rounds():
+    p1 = UTMTFT(0.6, 0.05, 0.5, 0.3, 0.2)
+    axl.Match((p1, axl.Alternator()), turns=6).play()
+
+    meter = TrustMeter(0.6, 0.05, 0.5, 0.3)
+    # The last round's outcome is observed only when a seventh move is asked for.
+    for my, opp in list(zip(p1.history, p1.history.coplays))[:-1]:
+        meter.observe_moves(my, opp)
+    assert p1.trust.value == meter.value
+
+
+def test_reward_overrides_apply_to_the_next_match():
+    p1 = UTMTFT()
+    with temporary_ipd_reward_values(0.9, 0.4, -0.3, -0.8):
+        axl.Match((p1, axl.Cooperator()), turns=2).play()
+        assert p1._last_reward == 0.9
+    axl.Match((p1, axl.Cooperator()), turns=2).play()
+    assert p1._last_reward == 1.0
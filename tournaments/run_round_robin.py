@@ -19,7 +19,7 @@ from __future__ import annotations
 import logging
 import os
 from pathlib import Path
-from typing import Iterable, Optional, Tuple, Union
+from typing import Iterable, Optional, Sequence, Tuple, Union
 
 import axelrod as axl
 import numpy as np
@@ -32,7 +32,7 @@ if not logging.getLogger().hasHandlers():
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
-def _scores_stats(results: axl.ResultSet, player_names: list[str]) -> tuple[list[float], list[float], list[float]]:
+def _scores_stats(results: axl.ResultSet, player_names: Sequence[str]) -> tuple[list[float], list[float], list[float]]:
     """
     Extract mean, median, stdev per player in a version-agnostic way.
 
@@ -56,9 +56,12 @@ def _scores_stats(results: axl.ResultSet, player_names: list[str]) -> tuple[list
     except AttributeError as exc:  # pragma: no cover
         raise RuntimeError("Unsupported Axelrod version – cannot retrieve scores") from exc
 
-    means   = [float(np.mean(s))   if s else float("nan") for s in nscores]
-    medians = [float(np.median(s)) if s else float("nan") for s in nscores]
-    stds    = [float(np.std(s))    if s else float("nan") for s in nscores]
+    # One array per player, shared by all three statistics
+    arrs = [np.asarray(s, dtype=np.float64) for s in nscores]
+    nan = float("nan")
+    means   = [float(a.mean())      if a.size else nan for a in arrs]
+    medians = [float(np.median(a))  if a.size else nan for a in arrs]
+    stds    = [float(a.std())       if a.size else nan for a in arrs]
     return means, medians, stds
 
 def _coop_rates(resultset: axl.ResultSet) -> list[float]:
@@ -78,10 +81,9 @@ def _coop_rates(resultset: axl.ResultSet) -> list[float]:
 
     # Last-ditch: average the NxN matrix that is always present
     if hasattr(resultset, "normalised_cooperation"):
-        mat = resultset.normalised_cooperation
-        n   = len(mat)
-        return [float(np.mean([mat[i][j] for j in range(n) if j != i]))
-                for i in range(n)]
+        arr = np.asarray(resultset.normalised_cooperation, dtype=np.float64)
+        n   = arr.shape[0]
+        return ((arr.sum(axis=1) - np.diag(arr)) / (n - 1)).tolist()
 
     raise AttributeError("ResultSet has no cooperation-rate data.")
 
@@ -98,6 +100,8 @@ def run_tournament(
     quiet: bool = False,
     csv_dir: Optional[str] = None,
     return_results: bool = False,
+    edges: Optional[list[tuple[int, int]]] = None,
+    processes: Optional[int] = None,
 ) -> Union[pd.DataFrame, Tuple[pd.DataFrame, axl.ResultSet]]:
 
     """
@@ -122,6 +126,14 @@ def run_tournament(
     return_results : bool, default False
         If *True*, returns a ``(DataFrame, ResultSet)`` tuple; otherwise
         just the leaderboard DataFrame.
+    edges : list of (int, int) or None, default None
+        Player-index pairs to play instead of the full round robin (see
+        `axl.Tournament`).  Scores stay averaged over each player's own
+        matches, but the ``#C`` / ``#D`` diagnostics assume a full round
+        robin.  None → every pairing, including self-play.
+    processes : int or None, default None
+        Worker processes Axelrod spreads the matches over.  None → play
+        serially.  Note Axelrod treats values below 2 as "all cores".
 
     Returns
     -------
@@ -137,10 +149,12 @@ def run_tournament(
     * CSV output uses Axelrod’s built-in mechanism, controlled via env vars.
     """
 
-    player_names = [str(p) for p in players]
+    players = list(players)  # single pass; generators would be exhausted below
+    # Object array so the sorted leaderboard can fancy-index it
+    player_names = np.asarray([str(p) for p in players], dtype=object)
     log.info(
         "Tournament config → players=%s | turns=%d | reps=%d | seed=%s | csv_dir=%s",
-        player_names, turns, repetitions, seed, csv_dir or "disabled",
+        player_names.tolist(), turns, repetitions, seed, csv_dir or "disabled",
     )
 
     # ------------------------------------------------------------------
@@ -158,15 +172,16 @@ def run_tournament(
     # ------------------------------------------------------------------
     # Run tournament
     # ------------------------------------------------------------------
-    tournament = axl.Tournament(
-        list(players),
+    tournament_kw = dict(
         turns=turns,
         repetitions=repetitions,
         seed=seed,
         noise=noise if noise and noise > 0 else 0,
+        edges=edges,
     )
+    tournament = axl.Tournament(players, **tournament_kw)
     log.info("Playing tournament…")
-    results = tournament.play(progress_bar=not quiet)
+    results = tournament.play(progress_bar=not quiet, processes=processes)
     log.info("Tournament complete")
 
     means, medians, stds = _scores_stats(results, player_names)
@@ -175,43 +190,44 @@ def run_tournament(
     # Cooperation statistics (API changed v5 → v6)
     # ------------------------------------------------------------------
     
-    coop_rates = _coop_rates(results)
-    coop_pct      = [round(r * 100, 1) for r in coop_rates]
+    coop_rates    = np.asarray(_coop_rates(results), dtype=np.float64)
     total_turns   = turns * repetitions * (len(players) - 1)
-    coop_counts   = [int(round(r * total_turns)) for r in coop_rates]
-    defect_counts = [total_turns - c for c in coop_counts]
+    coop_counts   = np.rint(coop_rates * total_turns).astype(np.int64)
+    defect_counts = total_turns - coop_counts
 
-    summary = pd.DataFrame(
-        {
-            "Strategy": player_names,
-            "Mean":    [round(m, 3) for m in means],
-            "Median":  [round(m, 3) for m in medians],
-            "Stdev":   [round(s, 3) for s in stds],
-            "% Coop":  coop_pct,
-        }
-    )
-    log.info("Run summary:\n%s", summary.to_string(index=False))
+    means   = np.asarray(means, dtype=np.float64)
+    medians = np.asarray(medians, dtype=np.float64)
+    stds    = np.asarray(stds, dtype=np.float64)
 
     # ------------------------------------------------------------------
     # Diagnostic leaderboard (adds counts of C/D)
     # ------------------------------------------------------------------
 
+    # Sort the key, not the frame: best mean first, ties in entry order,
+    # NaN last.
+    order = np.argsort(-means, kind="stable")
     df = pd.DataFrame(
         {
-            "Player":  player_names,
-            "Mean":    means,
-            "Median":  medians,
-            "Stdev":   stds,
-            "#C":      coop_counts,
-            "#D":      defect_counts,
-            "C-rate":  [round(r, 3) if not np.isnan(r) else np.nan for r in coop_rates],
+            "Player":  player_names[order],
+            "Mean":    means[order],
+            "Median":  medians[order],
+            "Stdev":   stds[order],
+            "#C":      coop_counts[order],
+            "#D":      defect_counts[order],
+            "C-rate":  np.round(coop_rates, 3)[order],
         }
-    ).sort_values("Mean", ascending=False).reset_index(drop=True)
+    )
+
+    if log.isEnabledFor(logging.INFO):   # the summary exists only for this log
+        summary = (
+            df[["Player", "Mean", "Median", "Stdev"]]
+            .round(3)
+            .rename(columns={"Player": "Strategy"})
+            .assign(**{"% Coop": np.round(coop_rates[order] * 100, 1)})
+        )
+        log.info("Run summary:\n%s", summary.to_string(index=False))
 
-    if not quiet:
-        try:
-            log.info("Leaderboard with diagnostics:\n%s", df.to_markdown(index=False))
-        except Exception:
-            log.info("Leaderboard with diagnostics:\n%s", df.to_string(index=False))
+    if not quiet and log.isEnabledFor(logging.INFO):
+        log.info("Leaderboard with diagnostics:\n%s", df.to_string(index=False))
 
     return (df, results) if return_results else df
@@ -15,9 +15,9 @@ n            → `self._betrayals`
 
 The only Iterated-Prisoner-Dilemma (IPD) glue is:
     * `_REWARD_TABLE`
-    * `payoff_to_signed_reward`
+    * `payoff_to_signed_reward` (and its array form `payoff_to_signed_rewards`)
     * `observe_moves`
-If you port UTM to another domain, replace those three bits with a
+If you port UTM to another domain, replace those bits with a
 domain-specific outcome-to-reward mapper.  Everything else is generic UTM.
 
 Notes
@@ -38,7 +38,10 @@ from __future__ import annotations
 import logging
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Final, Iterator
+from typing import Final, Iterator, TypeVar
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +75,34 @@ IPD_REWARD_MATRIX_DEFAULTS: Final[dict[tuple[str, str], float]] = {
 
 _IPD_REWARD_MATRIX: dict[tuple[str, str], float] = dict(IPD_REWARD_MATRIX_DEFAULTS)
 
+
+_Move = TypeVar("_Move")
+
+
+def _reward_lookup(
+    matrix: dict[tuple[str, str], float],
+    cooperate: _Move = "C",
+    defect: _Move = "D",
+) -> dict[_Move, dict[_Move, float]]:
+    """Nested ``[my_move][opp_move]`` view of *matrix*; no tuple key per call.
+
+    *cooperate* / *defect* are the keys the view uses in place of "C" / "D".
+    """
+    return {
+        cooperate: {cooperate: matrix[("C", "C")], defect: matrix[("C", "D")]},
+        defect: {cooperate: matrix[("D", "C")], defect: matrix[("D", "D")]},
+    }
+
+
+_IPD_REWARD_LOOKUP = _reward_lookup(_IPD_REWARD_MATRIX)
+
+def ipd_reward_lookup(cooperate: _Move = "C", defect: _Move = "D") -> dict[_Move, dict[_Move, float]]:
+    """Return a fresh ``[my_move][opp_move]`` view of the current reward matrix.
+
+    Moves are keyed by *cooperate* / *defect*, e.g. Axelrod `Action` members.
+    """
+    return _reward_lookup(_IPD_REWARD_MATRIX, cooperate, defect)
+
 def get_ipd_reward_values() -> tuple[float, float, float, float]:
     """Return IPD reward-matrix values as (R_CC, R_DC, R_DD, R_CD).
 
@@ -90,7 +121,7 @@ def set_ipd_reward_values(r_cc: float, r_dc: float, r_dd: float, r_cd: float) ->
 
     This helper is for academic IPD payoff/reward-matrix experiments only.
     """
-    global _IPD_REWARD_MATRIX
+    global _IPD_REWARD_MATRIX, _IPD_REWARD_LOOKUP
 
     def _nz(x: float, eps: float = 1e-6) -> float:
         return x if x != 0.0 else eps
@@ -101,6 +132,7 @@ def set_ipd_reward_values(r_cc: float, r_dc: float, r_dd: float, r_cd: float) ->
         ("D", "D"): _nz(r_dd),
         ("C", "D"): _nz(r_cd),
     }
+    _IPD_REWARD_LOOKUP = _reward_lookup(_IPD_REWARD_MATRIX)
 
 @contextmanager
 def temporary_ipd_reward_values(
@@ -141,21 +173,50 @@ def payoff_to_signed_reward(my_move: str, opp_move: str) -> float:
         If either move is not 'C' or 'D'.
     """
     try:
-        reward = _IPD_REWARD_MATRIX[(str(my_move), str(opp_move))]
+        reward = _IPD_REWARD_LOOKUP[str(my_move)][str(opp_move)]
+    except KeyError as exc:
+        logger.error("Invalid move pair (%s, %s)", my_move, opp_move)
+        raise ValueError("move must be 'C' or 'D'") from exc
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
             "payoff_to_signed_reward: my=%s, opp=%s → R=%.3f",
             my_move, opp_move, reward
         )
-        return reward
-    except KeyError as exc:
-        logger.error("Invalid move pair (%s, %s)", my_move, opp_move)
-        raise ValueError("move must be 'C' or 'D'") from exc
+    return reward
+
+def payoff_to_signed_rewards(my_defects: ArrayLike, opp_defects: ArrayLike) -> np.ndarray:
+    """Vectorised `payoff_to_signed_reward` over whole move histories.
+
+    Parameters
+    ----------
+    my_defects, opp_defects : array-like of {0, 1}
+        Per-round move codes, 0 = cooperate and 1 = defect (the values of
+        Axelrod's `Action.C` / `Action.D`).  Shapes must broadcast.
+
+    Returns
+    -------
+    numpy.ndarray
+        Signed reward per round, looked up in the current reward matrix.
+
+    Raises
+    ------
+    ValueError
+        If any code is not 0 or 1.
+    """
+    my = np.asarray(my_defects, dtype=np.intp)
+    opp = np.asarray(opp_defects, dtype=np.intp)
+    if ((my | opp) & ~1).any():
+        raise ValueError("move codes must be 0 (C) or 1 (D)")
+
+    r_cc, r_dc, r_dd, r_cd = get_ipd_reward_values()
+    lut = np.array([[r_cc, r_cd], [r_dc, r_dd]])    # [my move, opp move]
+    return lut[my, opp]
 
 
 # ────────────────────────────────────────────────────────────────────────────
 # Core class
 # ────────────────────────────────────────────────────────────────────────────
-@dataclass
+@dataclass(slots=True)
 class TrustMeter:
     """
     Online estimator of *my* trust in one partner, per the UTM update rule.
@@ -177,6 +238,8 @@ class TrustMeter:
     * Negative trust / active mistrust is not represented here; extend to
       [−1, 1] if your use-case needs it.
     * Internal counter `_betrayals` (n) increments only when `reward < trust`.
+    * Slotted: one meter lives per (player, opponent) pair per match, so
+      instances carry no ``__dict__``.
     """
 
     theta: float = 0.5
@@ -224,16 +287,67 @@ class TrustMeter:
         if reward == 0:
             raise ValueError("reward must be non-zero")
 
-        # Pick α based on “surprise” direction
-        alpha = self.alpha_pos if reward > self._trust else self.alpha_neg
+        # Each field is read once and written once; the maths runs on locals.
+        trust = self._trust
+        diff = reward - trust
+        if diff == 0.0:         # no surprise, no betrayal: nothing to update
+            return
+        betrayed = diff < 0.0
+
+        # Pick α based on “surprise” direction; a betrayal bumps n
+        alpha = self.alpha_neg if betrayed else self.alpha_pos
+        betrayals = self._betrayals + betrayed
+
+        factor = 1 + betrayals * self.delta                       # s · (1 + nδ)
+        if severity != 1.0:     # IPD rounds always use the default s = 1
+            factor *= severity
+        delta_t = alpha * factor * diff
+        self._betrayals = betrayals
+        self._trust = min(1.0, max(0.0, trust + delta_t))
+
+    def observe_many(self, rewards: ArrayLike, severity: float = 1.0) -> np.ndarray:
+        """Apply `observe` to each reward in turn, for replaying a history.
 
-        # Detect betrayal and bump n
-        if reward < self._trust:
-            self._betrayals += 1
+        The update maths is identical to `observe`; the meter state is held
+        in locals for the duration of the loop instead of being re-read
+        from the instance every step.
+
+        Parameters
+        ----------
+        rewards : array-like of float
+            Signed outcomes in (−1 … 1], oldest first, e.g. from
+            `payoff_to_signed_rewards`.
+        severity : float, default 1.0
+            Event severity s applied to every step.
+
+        Returns
+        -------
+        numpy.ndarray
+            Trust after each step.
+
+        Raises
+        ------
+        ValueError
+            If any reward == 0; the meter is left unchanged.
+        """
+        rs = np.asarray(rewards, dtype=np.float64).ravel()
+        if (rs == 0).any():
+            raise ValueError("reward must be non-zero")
 
-        factor  = severity * (1 + self._betrayals * self.delta)  # s · (1 + nδ)
-        delta_t = alpha * factor * (reward - self._trust)
-        self._trust = max(0.0, min(1.0, self._trust + delta_t))
+        trust, betrayals = self._trust, self._betrayals
+        alpha_pos, alpha_neg, delta = self.alpha_pos, self.alpha_neg, self.delta
+        out = np.empty(rs.size, dtype=np.float64)
+        for i, reward in enumerate(rs.tolist()):
+            diff = reward - trust
+            betrayed = diff < 0.0
+            alpha = alpha_neg if betrayed else alpha_pos
+            betrayals += betrayed
+            factor = severity * (1 + betrayals * delta)
+            trust = min(1.0, max(0.0, trust + alpha * factor * diff))
+            out[i] = trust
+
+        self._trust, self._betrayals = trust, betrayals
+        return out
 
     # ------------------------------------------------------------------
     # IPD convenience adapter